@@ -5,6 +5,9 @@ Generates complete 55,500+ input configuration
 15 groups × 3 engines × 7 logics × 2 directions = 630 logic-directions
 """
 
+import functools
+import itertools
+import operator
 import os
 from datetime import datetime
 
@@ -25,216 +28,291 @@ LOGIC_SUFFIX = {
     'RPO': 'X'
 }
 
-def generate_logic_inputs(group_num, engine, logic, direction):
-    """Generate all 88 inputs for a single logic-direction"""
-    prefix = f"gInput_{group_num}_{engine}{LOGIC_SUFFIX[logic]}_{direction}"
-    is_power = logic == 'Power'
-    is_buy = direction == 'Buy'
-    
-    inputs = []
-    
-    # 1. Metadata & Base (3 fields)
-    inputs.append(f"{prefix}_Enabled=1")
-    inputs.append(f"{prefix}_AllowBuy=1" if is_buy else f"{prefix}_AllowBuy=0")
-    inputs.append(f"{prefix}_AllowSell=0" if is_buy else f"{prefix}_AllowSell=1")
-    
-    # 2. Order Parameters (5 fields)
-    inputs.append(f"{prefix}_InitialLot=0.01")
-    inputs.append(f"{prefix}_LastLot=0.10")
-    inputs.append(f"{prefix}_Multiplier=1.20")
-    inputs.append(f"{prefix}_Grid={100 + (group_num * 20)}")  # Varying grid per group
-    inputs.append(f"{prefix}_GridBehavior=0")  # Counter-trend
-    
-    # 3. Trail Configuration (4 fields)
-    inputs.append(f"{prefix}_TrailMethod=0")  # Points
-    inputs.append(f"{prefix}_TrailValue={5.0 + (group_num * 0.5)}")
-    inputs.append(f"{prefix}_TrailStart={group_num * 2.0}")
-    inputs.append(f"{prefix}_TrailStep={5.0 + (group_num * 0.25)}")
+def _build_logic_template(is_power, is_buy):
+    """Build the str.format template for one logic-direction variant.
+
+    Everything that does not depend on the group number is baked in here,
+    once at import time, so each call only formats the per-group values.
+    """
+    lines = [
+        # 1. Metadata & Base (3 fields)
+        "{prefix}_Enabled=1",
+        f"{{prefix}}_AllowBuy={1 if is_buy else 0}",
+        f"{{prefix}}_AllowSell={0 if is_buy else 1}",
+        # 2. Order Parameters (5 fields)
+        "{prefix}_InitialLot=0.01",
+        "{prefix}_LastLot=0.10",
+        "{prefix}_Multiplier=1.20",
+        "{prefix}_Grid={grid}",  # Varying grid per group
+        "{prefix}_GridBehavior=0",  # Counter-trend
+        # 3. Trail Configuration (4 fields)
+        "{prefix}_TrailMethod=0",  # Points
+        "{prefix}_TrailValue={trail_value}",
+        "{prefix}_TrailStart={trail_start}",
+        "{prefix}_TrailStep={trail_step}",
+    ]
     
     # 4. Trail Steps [7] × 5 fields = 35 fields
     for step in range(1, 8):
-        step_value = 5.0 + (step * 5.0) + (group_num * 0.5)
-        inputs.append(f"{prefix}_TrailStep{step}={step_value:.1f}")
-        inputs.append(f"{prefix}_TrailStepMethod{step}=0")  # Points
-        inputs.append(f"{prefix}_TrailStepMode{step}=0")  # Auto
-        inputs.append(f"{prefix}_TrailStepCycle{step}={step}")
-        inputs.append(f"{prefix}_TrailStepBalance{step}=0.0")
-    
-    # 5. Take Profit / Stop Loss (6 fields)
-    inputs.append(f"{prefix}_UseTP=1")
-    inputs.append(f"{prefix}_TakeProfit={50.0 + (group_num * 10.0)}")
-    inputs.append(f"{prefix}_TPMode=0")  # Points
-    inputs.append(f"{prefix}_UseSL=1")
-    inputs.append(f"{prefix}_StopLoss={30.0 + (group_num * 5.0)}")
-    inputs.append(f"{prefix}_SLMode=0")  # Points
-    
-    # 6. Breakeven (4 fields)
-    inputs.append(f"{prefix}_BreakEvenMode=0")
-    inputs.append(f"{prefix}_BreakEvenActivation={20.0 + (group_num * 2.0)}")
-    inputs.append(f"{prefix}_BreakEvenLock={10.0 + group_num}")
-    inputs.append(f"{prefix}_BreakEvenTrail=0")
-    
-    # 7. Profit Trail (5 fields)
-    inputs.append(f"{prefix}_ProfitTrailEnabled=0")
-    inputs.append(f"{prefix}_ProfitTrailPeakDrop=50.0")
-    inputs.append(f"{prefix}_ProfitTrailLock=30.0")
-    inputs.append(f"{prefix}_ProfitTrailCloseOnTrigger=0")
-    inputs.append(f"{prefix}_ProfitTrailUseBreakEven=0")
-    
-    # 8. Entry Triggers (4 fields)
-    inputs.append(f"{prefix}_TriggerType=0")  # Immediate
-    inputs.append(f"{prefix}_TriggerBars=0")
-    inputs.append(f"{prefix}_TriggerMinutes=0")
-    inputs.append(f"{prefix}_TriggerPips=0.0")
-    
-    # 9. Cross-Logic References (8 fields)
-    inputs.append(f"{prefix}_ReverseReference=0")  # None
-    inputs.append(f"{prefix}_HedgeReference=0")  # None
-    inputs.append(f"{prefix}_OrderCountRefLogic=0")
-    inputs.append(f"{prefix}_ReverseScale=1.0")
-    inputs.append(f"{prefix}_HedgeScale=1.0")
-    inputs.append(f"{prefix}_ReverseEnabled=0")
-    inputs.append(f"{prefix}_HedgeEnabled=0")
-    inputs.append(f"{prefix}_CloseTargets=0")
+        lines.append(f"{{prefix}}_TrailStep{step}={{trail_step_{step}}}")
+        lines.append(f"{{prefix}}_TrailStepMethod{step}=0")  # Points
+        lines.append(f"{{prefix}}_TrailStepMode{step}=0")  # Auto
+        lines.append(f"{{prefix}}_TrailStepCycle{step}={step}")
+        lines.append(f"{{prefix}}_TrailStepBalance{step}=0.0")
     
-    # 10. Engine-Specific (4 fields, Power has no start_level)
-    inputs.append(f"{prefix}_OrderCountRef=0")
-    if not is_power:
-        inputs.append(f"{prefix}_StartLevel={group_num}")
-    else:
-        inputs.append(f"{prefix}_StartLevel=0")
-    inputs.append(f"{prefix}_ResetLotOnRestart=1")
-    inputs.append(f"{prefix}_RestartPolicy=0")
+    lines += [
+        # 5. Take Profit / Stop Loss (6 fields)
+        "{prefix}_UseTP=1",
+        "{prefix}_TakeProfit={take_profit}",
+        "{prefix}_TPMode=0",  # Points
+        "{prefix}_UseSL=1",
+        "{prefix}_StopLoss={stop_loss}",
+        "{prefix}_SLMode=0",  # Points
+        # 6. Breakeven (4 fields)
+        "{prefix}_BreakEvenMode=0",
+        "{prefix}_BreakEvenActivation={be_activation}",
+        "{prefix}_BreakEvenLock={be_lock}",
+        "{prefix}_BreakEvenTrail=0",
+        # 7. Profit Trail (5 fields)
+        "{prefix}_ProfitTrailEnabled=0",
+        "{prefix}_ProfitTrailPeakDrop=50.0",
+        "{prefix}_ProfitTrailLock=30.0",
+        "{prefix}_ProfitTrailCloseOnTrigger=0",
+        "{prefix}_ProfitTrailUseBreakEven=0",
+        # 8. Entry Triggers (4 fields)
+        "{prefix}_TriggerType=0",  # Immediate
+        "{prefix}_TriggerBars=0",
+        "{prefix}_TriggerMinutes=0",
+        "{prefix}_TriggerPips=0.0",
+        # 9. Cross-Logic References (8 fields)
+        "{prefix}_ReverseReference=0",  # None
+        "{prefix}_HedgeReference=0",  # None
+        "{prefix}_OrderCountRefLogic=0",
+        "{prefix}_ReverseScale=1.0",
+        "{prefix}_HedgeScale=1.0",
+        "{prefix}_ReverseEnabled=0",
+        "{prefix}_HedgeEnabled=0",
+        "{prefix}_CloseTargets=0",
+        # 10. Engine-Specific (4 fields, Power has no start_level)
+        "{prefix}_OrderCountRef=0",
+        "{prefix}_StartLevel=0" if is_power else "{prefix}_StartLevel={group_num}",
+        "{prefix}_ResetLotOnRestart=1",
+        "{prefix}_RestartPolicy=0",
+    ]
     
     # 11. Partial Close [4] × 8 fields = 32 fields
     for partial in range(1, 5):
-        inputs.append(f"{prefix}_PartialEnabled{partial}=0")
-        inputs.append(f"{prefix}_PartialCycle{partial}={partial + 1}")
-        inputs.append(f"{prefix}_PartialMode{partial}=1")  # Mid
-        inputs.append(f"{prefix}_PartialBalance{partial}=1")  # Balanced
-        inputs.append(f"{prefix}_PartialTrailMode{partial}=0")  # Auto
-        inputs.append(f"{prefix}_PartialTrigger{partial}=0")  # Cycle
-        inputs.append(f"{prefix}_PartialProfitThreshold{partial}=0.0")
-        inputs.append(f"{prefix}_PartialHours{partial}=0")
+        lines.append(f"{{prefix}}_PartialEnabled{partial}=0")
+        lines.append(f"{{prefix}}_PartialCycle{partial}={partial + 1}")
+        lines.append(f"{{prefix}}_PartialMode{partial}=1")  # Mid
+        lines.append(f"{{prefix}}_PartialBalance{partial}=1")  # Balanced
+        lines.append(f"{{prefix}}_PartialTrailMode{partial}=0")  # Auto
+        lines.append(f"{{prefix}}_PartialTrigger{partial}=0")  # Cycle
+        lines.append(f"{{prefix}}_PartialProfitThreshold{partial}=0.0")
+        lines.append(f"{{prefix}}_PartialHours{partial}=0")
     
-    return inputs
+    return "\n".join(lines)
 
-def generate_global_inputs():
-    """Generate ~50 global inputs"""
-    inputs = []
-    
+# One template per (is_power, is_buy) variant, built once at import
+_LOGIC_TEMPLATES = {
+    (is_power, is_buy): _build_logic_template(is_power, is_buy)
+    for is_power in (False, True)
+    for is_buy in (False, True)
+}
+
+# Every variant has the same number of fields
+FIELDS_PER_LOGIC = _LOGIC_TEMPLATES[(False, True)].count("\n") + 1
+
+def _group_values(group_num):
+    """Template values for one group, already formatted to their final text"""
+    values = {
+        "group_num": str(group_num),
+        "grid": str(100 + (group_num * 20)),
+        "trail_value": str(5.0 + (group_num * 0.5)),
+        "trail_start": str(group_num * 2.0),
+        "trail_step": str(5.0 + (group_num * 0.25)),
+        "take_profit": str(50.0 + (group_num * 10.0)),
+        "stop_loss": str(30.0 + (group_num * 5.0)),
+        "be_activation": str(20.0 + (group_num * 2.0)),
+        "be_lock": str(10.0 + group_num),
+    }
+    for step in range(1, 8):
+        values[f"trail_step_{step}"] = f"{5.0 + (step * 5.0) + (group_num * 0.5):.1f}"
+    return values
+
+# Per-group values, indexed by group number (1-based)
+_PER_GROUP = (None,) + tuple(_group_values(g) for g in range(1, GROUPS + 1))
+
+def _encode(text):
+    """Encode generated text for the binary output file.
+
+    Newlines are translated to os.linesep, as a text-mode file would do.
+    """
+    return text.replace("\n", os.linesep).encode('utf-8')
+
+@functools.lru_cache(maxsize=None)
+def _body_for(is_power, is_buy, group_num):
+    """Encoded logic block for one variant/group, prefix left as {prefix}"""
+    return _encode(_LOGIC_TEMPLATES[(is_power, is_buy)].format(prefix="{prefix}", **_PER_GROUP[group_num]))
+
+def generate_logic_inputs(group_num, prefix, is_power, is_buy):
+    """Render one logic-direction's inputs as encoded bytes.
+
+    prefix is the already-encoded input prefix (e.g. b"gInput_1_AP_Buy").
+    """
+    # Content only depends on (is_power, is_buy, group_num); the rest is the prefix
+    return _body_for(is_power, is_buy, group_num).replace(b"{prefix}", prefix)
+
+GLOBAL_SECTION_HEADER = (
+    "; ===========================================\n"
+    "; GLOBAL SETTINGS\n"
+    "; ===========================================\n"
+    "\n"
+)
+
+LOGIC_SECTION_HEADER = (
+    "; ===========================================\n"
+    "; LOGIC CONFIGURATIONS (630 logic-directions)\n"
+    "; ===========================================\n"
+    "\n"
+)
+
+# ~50 global inputs; constant, so built once as a single block of text
+GLOBAL_INPUTS_TEXT = (
     # Global Settings
-    inputs.append("gInput_MagicNumber=777")
-    inputs.append("gInput_MagicNumberBuy=777")
-    inputs.append("gInput_MagicNumberSell=888")
-    inputs.append("gInput_EnableLogs=0")
-    inputs.append("gInput_AllowBuy=1")
-    inputs.append("gInput_AllowSell=1")
-    inputs.append("gInput_MaxSlippage=3")
-    inputs.append("gInput_MaxSpread=50")
-    inputs.append("gInput_MaxOrders=100")
-    inputs.append("gInput_MaxDailyLoss=0")
-    inputs.append("gInput_MaxDrawdown=0")
-    inputs.append("gInput_AutoCompounding=0")
-    inputs.append("gInput_CompoundingPercent=0.0")
-    inputs.append("gInput_RiskPercent=1.0")
-    inputs.append("gInput_LotSize=0.01")
-    inputs.append("gInput_UseMoneyManagement=0")
-    inputs.append("gInput_FixedLot=0.01")
-    
+    "gInput_MagicNumber=777\n"
+    "gInput_MagicNumberBuy=777\n"
+    "gInput_MagicNumberSell=888\n"
+    "gInput_EnableLogs=0\n"
+    "gInput_AllowBuy=1\n"
+    "gInput_AllowSell=1\n"
+    "gInput_MaxSlippage=3\n"
+    "gInput_MaxSpread=50\n"
+    "gInput_MaxOrders=100\n"
+    "gInput_MaxDailyLoss=0\n"
+    "gInput_MaxDrawdown=0\n"
+    "gInput_AutoCompounding=0\n"
+    "gInput_CompoundingPercent=0.0\n"
+    "gInput_RiskPercent=1.0\n"
+    "gInput_LotSize=0.01\n"
+    "gInput_UseMoneyManagement=0\n"
+    "gInput_FixedLot=0.01\n"
+
     # Session Settings
-    inputs.append("gInput_TradeMonday=1")
-    inputs.append("gInput_TradeTuesday=1")
-    inputs.append("gInput_TradeWednesday=1")
-    inputs.append("gInput_TradeThursday=1")
-    inputs.append("gInput_TradeFriday=1")
-    inputs.append("gInput_TradeSaturday=0")
-    inputs.append("gInput_TradeSunday=0")
-    inputs.append("gInput_StartHour=0")
-    inputs.append("gInput_EndHour=24")
-    inputs.append("gInput_UseSessionFilter=0")
-    inputs.append("gInput_SessionStart=0")
-    inputs.append("gInput_SessionEnd=24")
-    
+    "gInput_TradeMonday=1\n"
+    "gInput_TradeTuesday=1\n"
+    "gInput_TradeWednesday=1\n"
+    "gInput_TradeThursday=1\n"
+    "gInput_TradeFriday=1\n"
+    "gInput_TradeSaturday=0\n"
+    "gInput_TradeSunday=0\n"
+    "gInput_StartHour=0\n"
+    "gInput_EndHour=24\n"
+    "gInput_UseSessionFilter=0\n"
+    "gInput_SessionStart=0\n"
+    "gInput_SessionEnd=24\n"
+
     # Filter Settings
-    inputs.append("gInput_UseTrendFilter=0")
-    inputs.append("gInput_TrendPeriod=14")
-    inputs.append("gInput_UseVolatilityFilter=0")
-    inputs.append("gInput_VolatilityPeriod=20")
-    inputs.append("gInput_UseNewsFilter=0")
-    inputs.append("gInput_NewsImpact=3")
-    inputs.append("gInput_MinsBeforeNews=30")
-    inputs.append("gInput_MinsAfterNews=30")
-    
+    "gInput_UseTrendFilter=0\n"
+    "gInput_TrendPeriod=14\n"
+    "gInput_UseVolatilityFilter=0\n"
+    "gInput_VolatilityPeriod=20\n"
+    "gInput_UseNewsFilter=0\n"
+    "gInput_NewsImpact=3\n"
+    "gInput_MinsBeforeNews=30\n"
+    "gInput_MinsAfterNews=30\n"
+
     # Advanced Settings
-    inputs.append("gInput_UseVirtualPending=0")
-    inputs.append("gInput_VirtualPendingPips=10.0")
-    inputs.append("gInput_OrderComment=DAAVILEFX")
-    inputs.append("gInput_RequireLicense=0")
-    inputs.append("gInput_LicenseServer=https://license.daavfx.com")
-    inputs.append("gInput_ShowUI=1")
-    inputs.append("gInput_ShowTrails=0")
-    inputs.append("gInput_EnableDebug=0")
-    inputs.append("gInput_LogLevel=1")
-    inputs.append("gInput_SaveStats=1")
-    inputs.append("gInput_StatsFile=daavilefx_stats.csv")
-    
-    return inputs
+    "gInput_UseVirtualPending=0\n"
+    "gInput_VirtualPendingPips=10.0\n"
+    "gInput_OrderComment=DAAVILEFX\n"
+    "gInput_RequireLicense=0\n"
+    "gInput_LicenseServer=https://license.daavfx.com\n"
+    "gInput_ShowUI=1\n"
+    "gInput_ShowTrails=0\n"
+    "gInput_EnableDebug=0\n"
+    "gInput_LogLevel=1\n"
+    "gInput_SaveStats=1\n"
+    "gInput_StatsFile=daavilefx_stats.csv\n"
+)
+GLOBAL_INPUT_COUNT = GLOBAL_INPUTS_TEXT.count("\n")
+
+# The whole (group, engine, logic, direction) space, flattened once:
+# (group, encoded prefix, is_power, is_buy)
+_ITERATIONS = tuple(
+    (group, f"gInput_{group}_{engine}{LOGIC_SUFFIX[logic]}_{direction}".encode('ascii'),
+     logic == 'Power', direction == 'Buy')
+    for group in range(1, GROUPS + 1)
+    for engine in ENGINES
+    for logic in LOGICS
+    for direction in DIRECTIONS
+)
+
+# Constant sections, encoded once
+_GLOBAL_SECTION_BYTES = _encode(GLOBAL_SECTION_HEADER + GLOBAL_INPUTS_TEXT + "\n")
+_LOGIC_SECTION_BYTES = _encode(LOGIC_SECTION_HEADER)
+_LOGIC_SEPARATOR = _encode("\n\n")
+_GROUP_SEPARATOR = _encode("\n")
+
+def generate_massive_setfile(fh):
+    """Stream complete massive setfile with all 55,500+ inputs to fh (binary).
 
-def generate_massive_setfile():
-    """Generate complete massive setfile with all 55,500+ inputs"""
-    lines = []
+    Returns the number of lines written.
+    """
+    n_engines, n_logics, n_directions = len(ENGINES), len(LOGICS), len(DIRECTIONS)
+    n_logic_directions = GROUPS * n_engines * n_logics * n_directions
+    
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
     # Header
-    lines.append("; DAAVILEFX MASSIVE CONFIGURATION SETFILE")
-    lines.append(f"; Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("; Version: 18.0 MASSIVE")
-    lines.append("; Platform: MT4")
-    lines.append(";")
-    lines.append(f"; Structure: {GROUPS} groups × {len(ENGINES)} engines × {len(LOGICS)} logics × {len(DIRECTIONS)} directions")
-    lines.append(f"; Total Logic-Directions: {GROUPS * len(ENGINES) * len(LOGICS) * len(DIRECTIONS)}")
-    lines.append(f"; Fields per Logic: 88")
-    lines.append(f"; Total Logic Inputs: {GROUPS * len(ENGINES) * len(LOGICS) * len(DIRECTIONS) * 88}")
-    lines.append(f"; Global Inputs: ~50")
-    lines.append(f"; GRAND TOTAL: ~55,500 inputs")
-    lines.append("")
+    header = (
+        "; DAAVILEFX MASSIVE CONFIGURATION SETFILE\n"
+        f"; Generated: {timestamp}\n"
+        "; Version: 18.0 MASSIVE\n"
+        "; Platform: MT4\n"
+        ";\n"
+        f"; Structure: {GROUPS} groups × {n_engines} engines × {n_logics} logics × {n_directions} directions\n"
+        f"; Total Logic-Directions: {n_logic_directions}\n"
+        "; Fields per Logic: 88\n"
+        f"; Total Logic Inputs: {n_logic_directions * 88}\n"
+        "; Global Inputs: ~50\n"
+        "; GRAND TOTAL: ~55,500 inputs\n"
+        "\n"
+    )
+    fh.write(_encode(header))
+    line_count = header.count("\n")
     
     # Global Settings Section
-    lines.append("; ===========================================")
-    lines.append("; GLOBAL SETTINGS")
-    lines.append("; ===========================================")
-    lines.append("")
-    lines.extend(generate_global_inputs())
-    lines.append("")
+    fh.write(_GLOBAL_SECTION_BYTES)
+    line_count += GLOBAL_SECTION_HEADER.count("\n") + GLOBAL_INPUT_COUNT + 1
     
     # Logic Inputs Section
-    lines.append("; ===========================================")
-    lines.append("; LOGIC CONFIGURATIONS (630 logic-directions)")
-    lines.append("; ===========================================")
-    lines.append("")
+    fh.write(_LOGIC_SECTION_BYTES)
+    line_count += LOGIC_SECTION_HEADER.count("\n")
+    
+    write = fh.write
+    for group, entries in itertools.groupby(_ITERATIONS, key=operator.itemgetter(0)):
+        write(_encode(f"; Group {group}\n; ===========================================\n"))
+        for _, prefix, is_power, is_buy in entries:
+            write(generate_logic_inputs(group, prefix, is_power, is_buy))
+            write(_LOGIC_SEPARATOR)  # Blank line between logics
+        write(_GROUP_SEPARATOR)
     
-    total_inputs = 0
-    for group in range(1, GROUPS + 1):
-        lines.append(f"; Group {group}")
-        lines.append(f"; ===========================================")
-        
-        for engine in ENGINES:
-            for logic in LOGICS:
-                for direction in DIRECTIONS:
-                    logic_inputs = generate_logic_inputs(group, engine, logic, direction)
-                    lines.extend(logic_inputs)
-                    total_inputs += len(logic_inputs)
-                    lines.append("")  # Blank line between logics
-        
-        lines.append("")
+    total_inputs = len(_ITERATIONS) * FIELDS_PER_LOGIC
+    # Per group: 2 banner lines + 1 blank; per logic-direction: its fields + 1 blank
+    line_count += GROUPS * 3 + len(_ITERATIONS) * (FIELDS_PER_LOGIC + 1)
     
     # Footer
-    lines.append("; ===========================================")
-    lines.append(f"; END OF CONFIGURATION")
-    lines.append(f"; Total Inputs Generated: {total_inputs + len(generate_global_inputs())}")
-    lines.append("; ===========================================")
+    footer = [
+        "; ===========================================",
+        f"; END OF CONFIGURATION",
+        f"; Total Inputs Generated: {total_inputs + GLOBAL_INPUT_COUNT}",
+        "; ===========================================",
+    ]
+    fh.write(_encode("\n".join(footer)))
+    line_count += len(footer)
     
-    return '\n'.join(lines)
+    return line_count
 
 def main():
     """Generate and save the massive setfile"""
@@ -246,23 +324,14 @@ def main():
     print(f"Expected inputs: ~55,500")
     print()
     
-    # Generate content
-    content = generate_massive_setfile()
-    
-    # Count lines
-    lines = content.split('\n')
-    print(f"Generated {len(lines)} lines")
-    
-    # Calculate file size estimate
-    file_size_mb = len(content.encode('utf-8')) / (1024 * 1024)
-    print(f"Estimated file size: {file_size_mb:.2f} MB")
+    # Generate straight into the file (64KB write buffer)
+    with open(output_file, 'wb', buffering=1 << 16) as f:
+        line_count = generate_massive_setfile(f)
     
-    # Save file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(content)
+    print(f"Generated {line_count} lines")
     
     print(f"\n✅ Saved to: {output_file}")
-    print(f"✅ Total inputs: {len(lines)}")
+    print(f"✅ Total inputs: {line_count}")
     print(f"✅ File size: {os.path.getsize(output_file) / (1024 * 1024):.2f} MB")
     
     return output_file
@@ -8,6 +8,7 @@ Changes from v18:
 - Additional random variations across groups/logics
 """
 
+import itertools
 import os
 import random
 from datetime import datetime
@@ -21,23 +22,18 @@ ENGINES = ['A', 'B', 'C']
 LOGICS = ['Power', 'Repower', 'Scalp', 'Stopper', 'STO', 'SCA', 'RPO']
 DIRECTIONS = ['Buy', 'Sell']
 
-# Logic suffix mapping for compact names
-LOGIC_SUFFIX = {
-    'Power': 'P',
-    'Repower': 'R',
-    'Scalp': 'S',
-    'Stopper': 'T',
-    'STO': 'O',
-    'SCA': 'C',
-    'RPO': 'X'
-}
+# Compact suffix for each entry of LOGICS (same order)
+LOGIC_SUFFIXES = ('P', 'R', 'S', 'T', 'O', 'C', 'X')
 
-def generate_logic_inputs(group_num, engine, logic, direction):
-    """Generate all 88 inputs for a single logic-direction with variations"""
-    prefix = f"gInput_{group_num}_{engine}{LOGIC_SUFFIX[logic]}_{direction}"
-    is_power = logic == 'Power'
-    is_buy = direction == 'Buy'
-    
+# Every (engine, suffix, direction, is_power, is_buy) in output order, resolved once
+COMBOS = tuple(
+    (engine, suffix, direction, logic == 'Power', direction == 'Buy')
+    for engine, (logic, suffix), direction
+    in itertools.product(ENGINES, zip(LOGICS, LOGIC_SUFFIXES), DIRECTIONS)
+)
+
+def _group_params(group_num):
+    """Deterministic (non-random) base values for one group"""
     # CHANGED: Base variations for testing
     # Group 1-5: Conservative
     # Group 6-10: Moderate  
@@ -58,233 +54,353 @@ def generate_logic_inputs(group_num, engine, logic, direction):
         grid_base = 200
         trail_base = 10.0
     
-    # Add some randomness for testing visibility
-    lot_variation = random.uniform(-0.005, 0.005)
-    grid_variation = random.uniform(-10, 10)
-    trail_variation = random.uniform(-1, 1)
-    
-    inputs = []
-    
-    # 1. Metadata & Base (3 fields)
-    inputs.append(f"{prefix}_Enabled=1")
-    inputs.append(f"{prefix}_AllowBuy=1" if is_buy else f"{prefix}_AllowBuy=0")
-    inputs.append(f"{prefix}_AllowSell=0" if is_buy else f"{prefix}_AllowSell=1")
-    
-    # 2. Order Parameters (5 fields) - CHANGED values
-    inputs.append(f"{prefix}_InitialLot={base_lot + lot_variation:.2f}")
-    inputs.append(f"{prefix}_LastLot={max_lot + (lot_variation * 2):.2f}")
-    inputs.append(f"{prefix}_Multiplier={1.20 + (group_num * 0.02):.2f}")
-    inputs.append(f"{prefix}_Grid={grid_base + (group_num * 20) + grid_variation:.1f}")
-    inputs.append(f"{prefix}_GridBehavior=0")
-    
-    # 3. Trail Configuration (4 fields) with variations
-    inputs.append(f"{prefix}_TrailMethod=0")
-    inputs.append(f"{prefix}_TrailValue={trail_base + (group_num * 0.5) + trail_variation:.1f}")
-    inputs.append(f"{prefix}_TrailStart={group_num * 2.0 + random.uniform(0, 2):.1f}")
-    inputs.append(f"{prefix}_TrailStep={trail_base + (group_num * 0.25) + random.uniform(-0.5, 0.5):.1f}")
+    return (
+        base_lot,
+        max_lot,
+        1.20 + (group_num * 0.02),                     # multiplier
+        grid_base + (group_num * 20),                  # grid before variation
+        trail_base + (group_num * 0.5),                # trail value before variation
+        group_num * 2.0,                               # trail start before variation
+        trail_base + (group_num * 0.25),               # trail step before variation
+        tuple(trail_base + (step * 5.0) + (group_num * 0.5) for step in range(1, 8)),
+        50.0 + (group_num * 10.0),                     # take profit before variation
+        30.0 + (group_num * 5.0),                      # stop loss before variation
+        20.0 + (group_num * 2.0),                      # breakeven activation before variation
+        10.0 + group_num,                              # breakeven lock before variation
+    )
+
+# Per-group base values, computed once instead of on each of the 42 calls per group
+GROUP_PARAMS = {g: _group_params(g) for g in range(1, GROUPS + 1)}
+
+def _build_logic_block_template():
+    """Build the format_map template for one logic-direction (88 fields).
+
+    {p} marks the input prefix; it is substituted with str.replace before
+    format_map fills in the values.
+    """
+    lines = [
+        # 1. Metadata & Base (3 fields)
+        "{p}_Enabled=1",
+        "{p}_AllowBuy={allow_buy}",
+        "{p}_AllowSell={allow_sell}",
+        # 2. Order Parameters (5 fields) - CHANGED values
+        "{p}_InitialLot={initial_lot:.2f}",
+        "{p}_LastLot={last_lot:.2f}",
+        "{p}_Multiplier={multiplier:.2f}",
+        "{p}_Grid={grid:.1f}",
+        "{p}_GridBehavior=0",
+        # 3. Trail Configuration (4 fields) with variations
+        "{p}_TrailMethod=0",
+        "{p}_TrailValue={trail_value:.1f}",
+        "{p}_TrailStart={trail_start:.1f}",
+        "{p}_TrailStep={trail_step:.1f}",
+    ]
     
     # 4. Trail Steps [7] × 5 fields = 35 fields with variations
     for step in range(1, 8):
-        step_variation = random.uniform(-2, 2)
-        step_value = trail_base + (step * 5.0) + (group_num * 0.5) + step_variation
-        inputs.append(f"{prefix}_TrailStep{step}={step_value:.1f}")
-        inputs.append(f"{prefix}_TrailStepMethod{step}=0")
-        inputs.append(f"{prefix}_TrailStepMode{step}=0")
-        inputs.append(f"{prefix}_TrailStepCycle{step}={step}")
-        inputs.append(f"{prefix}_TrailStepBalance{step}={random.uniform(0, 100):.1f}")
-    
-    # 5. Take Profit / Stop Loss (6 fields) with variations
-    inputs.append(f"{prefix}_UseTP=1")
-    tp_variation = random.uniform(-5, 5)
-    inputs.append(f"{prefix}_TakeProfit={50.0 + (group_num * 10.0) + tp_variation:.1f}")
-    inputs.append(f"{prefix}_TPMode=0")
-    inputs.append(f"{prefix}_UseSL=1")
-    sl_variation = random.uniform(-3, 3)
-    inputs.append(f"{prefix}_StopLoss={30.0 + (group_num * 5.0) + sl_variation:.1f}")
-    inputs.append(f"{prefix}_SLMode=0")
-    
-    # 6. Breakeven (4 fields) with variations
-    be_variation = random.uniform(-2, 2)
-    inputs.append(f"{prefix}_BreakEvenMode=0")
-    inputs.append(f"{prefix}_BreakEvenActivation={20.0 + (group_num * 2.0) + be_variation:.1f}")
-    inputs.append(f"{prefix}_BreakEvenLock={10.0 + group_num + be_variation * 0.5:.1f}")
-    inputs.append(f"{prefix}_BreakEvenTrail=0")
-    
-    # 7. Profit Trail (5 fields) with variations
-    pt_enabled = 1 if random.random() > 0.7 else 0  # 30% chance enabled
-    inputs.append(f"{prefix}_ProfitTrailEnabled={pt_enabled}")
-    inputs.append(f"{prefix}_ProfitTrailPeakDrop={random.uniform(40, 60):.1f}")
-    inputs.append(f"{prefix}_ProfitTrailLock={random.uniform(25, 35):.1f}")
-    inputs.append(f"{prefix}_ProfitTrailCloseOnTrigger={random.randint(0, 1)}")
-    inputs.append(f"{prefix}_ProfitTrailUseBreakEven={random.randint(0, 1)}")
-    
-    # 8. Entry Triggers (4 fields) with variations
-    trigger_type = random.randint(0, 2)  # Random trigger type for testing
-    inputs.append(f"{prefix}_TriggerType={trigger_type}")
-    inputs.append(f"{prefix}_TriggerBars={random.randint(0, 3)}")
-    inputs.append(f"{prefix}_TriggerMinutes={random.randint(0, 5)}")
-    inputs.append(f"{prefix}_TriggerPips={random.uniform(0, 5):.1f}")
-    
-    # 9. Cross-Logic References (8 fields) with random variations
-    inputs.append(f"{prefix}_ReverseReference={random.randint(0, 3)}")
-    inputs.append(f"{prefix}_HedgeReference={random.randint(0, 3)}")
-    inputs.append(f"{prefix}_OrderCountRefLogic={random.randint(0, 5)}")
-    inputs.append(f"{prefix}_ReverseScale={random.uniform(0.8, 1.2):.1f}")
-    inputs.append(f"{prefix}_HedgeScale={random.uniform(0.8, 1.2):.1f}")
-    inputs.append(f"{prefix}_ReverseEnabled={random.randint(0, 1)}")
-    inputs.append(f"{prefix}_HedgeEnabled={random.randint(0, 1)}")
-    inputs.append(f"{prefix}_CloseTargets={random.randint(0, 3)}")
-    
-    # 10. Engine-Specific (4 fields, Power has no start_level)
-    inputs.append(f"{prefix}_OrderCountRef={random.randint(0, 10)}")
-    if not is_power:
-        inputs.append(f"{prefix}_StartLevel={group_num + random.randint(0, 2)}")
-    else:
-        inputs.append(f"{prefix}_StartLevel=0")
-    inputs.append(f"{prefix}_ResetLotOnRestart={random.randint(0, 1)}")
-    inputs.append(f"{prefix}_RestartPolicy={random.randint(0, 2)}")
+        lines.append(f"{{p}}_TrailStep{step}={{trail_step_{step}:.1f}}")
+        lines.append(f"{{p}}_TrailStepMethod{step}=0")
+        lines.append(f"{{p}}_TrailStepMode{step}=0")
+        lines.append(f"{{p}}_TrailStepCycle{step}={step}")
+        lines.append(f"{{p}}_TrailStepBalance{step}={{trail_step_balance_{step}:.1f}}")
+    
+    lines += [
+        # 5. Take Profit / Stop Loss (6 fields) with variations
+        "{p}_UseTP=1",
+        "{p}_TakeProfit={take_profit:.1f}",
+        "{p}_TPMode=0",
+        "{p}_UseSL=1",
+        "{p}_StopLoss={stop_loss:.1f}",
+        "{p}_SLMode=0",
+        # 6. Breakeven (4 fields) with variations
+        "{p}_BreakEvenMode=0",
+        "{p}_BreakEvenActivation={be_activation:.1f}",
+        "{p}_BreakEvenLock={be_lock:.1f}",
+        "{p}_BreakEvenTrail=0",
+        # 7. Profit Trail (5 fields) with variations
+        "{p}_ProfitTrailEnabled={pt_enabled}",
+        "{p}_ProfitTrailPeakDrop={pt_peak_drop:.1f}",
+        "{p}_ProfitTrailLock={pt_lock:.1f}",
+        "{p}_ProfitTrailCloseOnTrigger={pt_close_on_trigger}",
+        "{p}_ProfitTrailUseBreakEven={pt_use_break_even}",
+        # 8. Entry Triggers (4 fields) with variations
+        "{p}_TriggerType={trigger_type}",
+        "{p}_TriggerBars={trigger_bars}",
+        "{p}_TriggerMinutes={trigger_minutes}",
+        "{p}_TriggerPips={trigger_pips:.1f}",
+        # 9. Cross-Logic References (8 fields) with random variations
+        "{p}_ReverseReference={reverse_reference}",
+        "{p}_HedgeReference={hedge_reference}",
+        "{p}_OrderCountRefLogic={order_count_ref_logic}",
+        "{p}_ReverseScale={reverse_scale:.1f}",
+        "{p}_HedgeScale={hedge_scale:.1f}",
+        "{p}_ReverseEnabled={reverse_enabled}",
+        "{p}_HedgeEnabled={hedge_enabled}",
+        "{p}_CloseTargets={close_targets}",
+        # 10. Engine-Specific (4 fields, Power has no start_level)
+        "{p}_OrderCountRef={order_count_ref}",
+        "{p}_StartLevel={start_level}",
+        "{p}_ResetLotOnRestart={reset_lot_on_restart}",
+        "{p}_RestartPolicy={restart_policy}",
+    ]
     
     # 11. Partial Close [4] × 8 fields = 32 fields with variations
     for partial in range(1, 5):
-        partial_enabled = 1 if random.random() > 0.6 else 0  # 40% chance
-        inputs.append(f"{prefix}_PartialEnabled{partial}={partial_enabled}")
-        inputs.append(f"{prefix}_PartialCycle{partial}={partial + random.randint(0, 2)}")
-        inputs.append(f"{prefix}_PartialMode{partial}={random.randint(0, 2)}")
-        inputs.append(f"{prefix}_PartialBalance{partial}={random.randint(0, 2)}")
-        inputs.append(f"{prefix}_PartialTrailMode{partial}={random.randint(0, 1)}")
-        inputs.append(f"{prefix}_PartialTrigger{partial}={random.randint(0, 2)}")
-        inputs.append(f"{prefix}_PartialProfitThreshold{partial}={random.uniform(0, 20):.1f}")
-        inputs.append(f"{prefix}_PartialHours{partial}={random.randint(0, 48)}")
-    
-    return inputs
+        lines.append(f"{{p}}_PartialEnabled{partial}={{partial_enabled_{partial}}}")
+        lines.append(f"{{p}}_PartialCycle{partial}={{partial_cycle_{partial}}}")
+        lines.append(f"{{p}}_PartialMode{partial}={{partial_mode_{partial}}}")
+        lines.append(f"{{p}}_PartialBalance{partial}={{partial_balance_{partial}}}")
+        lines.append(f"{{p}}_PartialTrailMode{partial}={{partial_trail_mode_{partial}}}")
+        lines.append(f"{{p}}_PartialTrigger{partial}={{partial_trigger_{partial}}}")
+        lines.append(f"{{p}}_PartialProfitThreshold{partial}={{partial_profit_threshold_{partial}:.1f}}")
+        lines.append(f"{{p}}_PartialHours{partial}={{partial_hours_{partial}}}")
+    
+    # Trailing blank line separates consecutive logic blocks
+    return "\n".join(lines) + "\n\n"
+
+LOGIC_BLOCK_TEMPLATE = _build_logic_block_template()
+FIELDS_PER_LOGIC = LOGIC_BLOCK_TEMPLATE.count("\n") - 1
+
+# Placeholder names for the trail-step / partial-close loops, built once at import
+_TRAIL_STEP_KEYS = tuple((f"trail_step_{step}", f"trail_step_balance_{step}") for step in range(1, 8))
+_PARTIAL_FIELDS = ('enabled', 'cycle', 'mode', 'balance', 'trail_mode', 'trigger',
+                   'profit_threshold', 'hours')
+_PARTIAL_KEYS = tuple(tuple(f"partial_{field}_{partial}" for field in _PARTIAL_FIELDS)
+                      for partial in range(1, 5))
 
-def generate_global_inputs():
-    """Generate ~50 global inputs with variations from v18"""
-    inputs = []
+def generate_logic_inputs(group_num, engine, logic_suffix, direction, is_power, is_buy, params):
+    """Generate all 88 inputs for a single logic-direction with variations.
+
+    Returns the block as one string, ending with its blank separator line.
+    Random values are drawn in field order to keep the seeded output
+    reproducible.
+    """
+    prefix = f"gInput_{group_num}_{engine}{logic_suffix}_{direction}"
+    (base_lot, max_lot, multiplier, grid, trail_value, trail_start, trail_step,
+     trail_steps, take_profit, stop_loss, be_activation, be_lock) = params
+    
+    # Bind the RNG methods once; ~75 draws per call.
+    # randint(a, b) is randrange(a, b + 1), so calling randrange directly
+    # skips a frame per draw without changing the seeded stream.
+    uniform, randrange, rand = random.uniform, random.randrange, random.random
     
+    # Add some randomness for testing visibility
+    lot_variation = uniform(-0.005, 0.005)
+    grid_variation = uniform(-10, 10)
+    trail_variation = uniform(-1, 1)
+    
+    values = {
+        "allow_buy": 1 if is_buy else 0,
+        "allow_sell": 0 if is_buy else 1,
+        "initial_lot": base_lot + lot_variation,
+        "last_lot": max_lot + (lot_variation * 2),
+        "multiplier": multiplier,
+        "grid": grid + grid_variation,
+        "trail_value": trail_value + trail_variation,
+        "trail_start": trail_start + uniform(0, 2),
+        "trail_step": trail_step + uniform(-0.5, 0.5),
+    }
+    
+    for step_base, (step_key, balance_key) in zip(trail_steps, _TRAIL_STEP_KEYS):
+        step_variation = uniform(-2, 2)
+        values[step_key] = step_base + step_variation
+        values[balance_key] = uniform(0, 100)
+    
+    values["take_profit"] = take_profit + uniform(-5, 5)
+    values["stop_loss"] = stop_loss + uniform(-3, 3)
+    
+    be_variation = uniform(-2, 2)
+    values["be_activation"] = be_activation + be_variation
+    values["be_lock"] = be_lock + be_variation * 0.5
+    
+    values["pt_enabled"] = 1 if rand() > 0.7 else 0  # 30% chance enabled
+    values["pt_peak_drop"] = uniform(40, 60)
+    values["pt_lock"] = uniform(25, 35)
+    values["pt_close_on_trigger"] = randrange(0, 2)
+    values["pt_use_break_even"] = randrange(0, 2)
+    
+    values["trigger_type"] = randrange(0, 3)  # Random trigger type for testing
+    values["trigger_bars"] = randrange(0, 4)
+    values["trigger_minutes"] = randrange(0, 6)
+    values["trigger_pips"] = uniform(0, 5)
+    
+    values["reverse_reference"] = randrange(0, 4)
+    values["hedge_reference"] = randrange(0, 4)
+    values["order_count_ref_logic"] = randrange(0, 6)
+    values["reverse_scale"] = uniform(0.8, 1.2)
+    values["hedge_scale"] = uniform(0.8, 1.2)
+    values["reverse_enabled"] = randrange(0, 2)
+    values["hedge_enabled"] = randrange(0, 2)
+    values["close_targets"] = randrange(0, 4)
+    
+    values["order_count_ref"] = randrange(0, 11)
+    values["start_level"] = 0 if is_power else group_num + randrange(0, 3)
+    values["reset_lot_on_restart"] = randrange(0, 2)
+    values["restart_policy"] = randrange(0, 3)
+    
+    for partial, keys in enumerate(_PARTIAL_KEYS, 1):
+        (enabled_key, cycle_key, mode_key, balance_key, trail_mode_key, trigger_key,
+         threshold_key, hours_key) = keys
+        values[enabled_key] = 1 if rand() > 0.6 else 0  # 40% chance
+        values[cycle_key] = partial + randrange(0, 3)
+        values[mode_key] = randrange(0, 3)
+        values[balance_key] = randrange(0, 3)
+        values[trail_mode_key] = randrange(0, 2)
+        values[trigger_key] = randrange(0, 3)
+        values[threshold_key] = uniform(0, 20)
+        values[hours_key] = randrange(0, 49)
+    
+    return LOGIC_BLOCK_TEMPLATE.replace("{p}", prefix).format_map(values)
+
+# ~50 global inputs with variations from v18; constant, so built once
+GLOBAL_INPUTS = (
     # Global Settings - some changed from v18
-    inputs.append("gInput_MagicNumber=777")
-    inputs.append("gInput_MagicNumberBuy=888")  # CHANGED from 777
-    inputs.append("gInput_MagicNumberSell=999")  # CHANGED from 888
-    inputs.append("gInput_EnableLogs=1")  # CHANGED from 0
-    inputs.append("gInput_AllowBuy=1")
-    inputs.append("gInput_AllowSell=1")
-    inputs.append("gInput_MaxSlippage=5")  # CHANGED from 3
-    inputs.append("gInput_MaxSpread=60")  # CHANGED from 50
-    inputs.append("gInput_MaxOrders=150")  # CHANGED from 100
-    inputs.append("gInput_MaxDailyLoss=5")  # CHANGED from 0
-    inputs.append("gInput_MaxDrawdown=10")  # CHANGED from 0
-    inputs.append("gInput_AutoCompounding=1")  # CHANGED from 0
-    inputs.append("gInput_CompoundingPercent=2.0")  # CHANGED from 0.0
-    inputs.append("gInput_RiskPercent=2.0")  # CHANGED from 1.0
-    inputs.append("gInput_LotSize=0.02")  # CHANGED from 0.01
-    inputs.append("gInput_UseMoneyManagement=1")  # CHANGED from 0
-    inputs.append("gInput_FixedLot=0.02")  # CHANGED from 0.01
-    
+    "gInput_MagicNumber=777",
+    "gInput_MagicNumberBuy=888",  # CHANGED from 777
+    "gInput_MagicNumberSell=999",  # CHANGED from 888
+    "gInput_EnableLogs=1",  # CHANGED from 0
+    "gInput_AllowBuy=1",
+    "gInput_AllowSell=1",
+    "gInput_MaxSlippage=5",  # CHANGED from 3
+    "gInput_MaxSpread=60",  # CHANGED from 50
+    "gInput_MaxOrders=150",  # CHANGED from 100
+    "gInput_MaxDailyLoss=5",  # CHANGED from 0
+    "gInput_MaxDrawdown=10",  # CHANGED from 0
+    "gInput_AutoCompounding=1",  # CHANGED from 0
+    "gInput_CompoundingPercent=2.0",  # CHANGED from 0.0
+    "gInput_RiskPercent=2.0",  # CHANGED from 1.0
+    "gInput_LotSize=0.02",  # CHANGED from 0.01
+    "gInput_UseMoneyManagement=1",  # CHANGED from 0
+    "gInput_FixedLot=0.02",  # CHANGED from 0.01
+
     # Session Settings - some inverted
-    inputs.append("gInput_TradeMonday=1")
-    inputs.append("gInput_TradeTuesday=1")
-    inputs.append("gInput_TradeWednesday=1")
-    inputs.append("gInput_TradeThursday=1")
-    inputs.append("gInput_TradeFriday=1")
-    inputs.append("gInput_TradeSaturday=0")
-    inputs.append("gInput_TradeSunday=0")
-    inputs.append("gInput_StartHour=1")  # CHANGED from 0
-    inputs.append("gInput_EndHour=23")  # CHANGED from 24
-    inputs.append("gInput_UseSessionFilter=1")  # CHANGED from 0
-    inputs.append("gInput_SessionStart=2")  # CHANGED from 0
-    inputs.append("gInput_SessionEnd=22")  # CHANGED from 24
-    
+    "gInput_TradeMonday=1",
+    "gInput_TradeTuesday=1",
+    "gInput_TradeWednesday=1",
+    "gInput_TradeThursday=1",
+    "gInput_TradeFriday=1",
+    "gInput_TradeSaturday=0",
+    "gInput_TradeSunday=0",
+    "gInput_StartHour=1",  # CHANGED from 0
+    "gInput_EndHour=23",  # CHANGED from 24
+    "gInput_UseSessionFilter=1",  # CHANGED from 0
+    "gInput_SessionStart=2",  # CHANGED from 0
+    "gInput_SessionEnd=22",  # CHANGED from 24
+
     # Filter Settings - enabled some
-    inputs.append("gInput_UseTrendFilter=1")  # CHANGED from 0
-    inputs.append("gInput_TrendPeriod=21")  # CHANGED from 14
-    inputs.append("gInput_UseVolatilityFilter=1")  # CHANGED from 0
-    inputs.append("gInput_VolatilityPeriod=14")  # CHANGED from 20
-    inputs.append("gInput_UseNewsFilter=1")  # CHANGED from 0
-    inputs.append("gInput_NewsImpact=2")  # CHANGED from 3
-    inputs.append("gInput_MinsBeforeNews=60")  # CHANGED from 30
-    inputs.append("gInput_MinsAfterNews=60")  # CHANGED from 30
-    
+    "gInput_UseTrendFilter=1",  # CHANGED from 0
+    "gInput_TrendPeriod=21",  # CHANGED from 14
+    "gInput_UseVolatilityFilter=1",  # CHANGED from 0
+    "gInput_VolatilityPeriod=14",  # CHANGED from 20
+    "gInput_UseNewsFilter=1",  # CHANGED from 0
+    "gInput_NewsImpact=2",  # CHANGED from 3
+    "gInput_MinsBeforeNews=60",  # CHANGED from 30
+    "gInput_MinsAfterNews=60",  # CHANGED from 30
+
     # Advanced Settings - enabled
-    inputs.append("gInput_UseVirtualPending=1")  # CHANGED from 0
-    inputs.append("gInput_VirtualPendingPips=15.0")  # CHANGED from 10.0
-    inputs.append("gInput_OrderComment=DAAVILEFX_v19")  # CHANGED
-    inputs.append("gInput_RequireLicense=0")
-    inputs.append("gInput_LicenseServer=https://license.daavfx.com")
-    inputs.append("gInput_ShowUI=1")
-    inputs.append("gInput_ShowTrails=1")  # CHANGED from 0
-    inputs.append("gInput_EnableDebug=1")  # CHANGED from 0
-    inputs.append("gInput_LogLevel=2")  # CHANGED from 1
-    inputs.append("gInput_SaveStats=1")
-    inputs.append("gInput_StatsFile=daavilefx_stats_v19.csv")  # CHANGED
+    "gInput_UseVirtualPending=1",  # CHANGED from 0
+    "gInput_VirtualPendingPips=15.0",  # CHANGED from 10.0
+    "gInput_OrderComment=DAAVILEFX_v19",  # CHANGED
+    "gInput_RequireLicense=0",
+    "gInput_LicenseServer=https://license.daavfx.com",
+    "gInput_ShowUI=1",
+    "gInput_ShowTrails=1",  # CHANGED from 0
+    "gInput_EnableDebug=1",  # CHANGED from 0
+    "gInput_LogLevel=2",  # CHANGED from 1
+    "gInput_SaveStats=1",
+    "gInput_StatsFile=daavilefx_stats_v19.csv",  # CHANGED
+)
+
+# Globals section as written: one input per line, then a blank line
+_GLOBAL_INPUTS_TEXT = "\n".join(GLOBAL_INPUTS) + "\n\n"
+
+_N_LOGIC_DIRECTIONS = GROUPS * len(COMBOS)
+
+# File header up to the global inputs; only the timestamp changes per run
+HEADER_TEMPLATE = (
+    "; DAAVILEFX MASSIVE CONFIGURATION SETFILE v19\n"
+    "; Generated: {timestamp}\n"
+    "; Version: 19.0 MASSIVE (Testing Variant)\n"
+    "; Platform: MT4\n"
+    ";\n"
+    f"; Structure: {GROUPS} groups × {len(ENGINES)} engines × {len(LOGICS)} logics × {len(DIRECTIONS)} directions\n"
+    f"; Total Logic-Directions: {_N_LOGIC_DIRECTIONS}\n"
+    "; Fields per Logic: 88\n"
+    f"; Total Logic Inputs: {_N_LOGIC_DIRECTIONS * 88}\n"
+    "; Global Inputs: ~50\n"
+    "; GRAND TOTAL: ~55,500 inputs\n"
+    ";\n"
+    "; CHANGES FROM v18:\n"
+    "; - InitialLot: 0.01 -> 0.02 (and higher for groups 6-15)\n"
+    "; - LastLot: 0.10 -> 0.20 (and higher for groups 6-15)\n"
+    "; - Added random variations across all parameters for testing\n"
+    "; - Enabled various filters and settings that were disabled\n"
+    "; - Changed magic numbers and session times\n"
+    "\n"
     
-    return inputs
+    # Global Settings Section
+    "; ===========================================\n"
+    "; GLOBAL SETTINGS (Changed from v18)\n"
+    "; ===========================================\n"
+    "\n"
+)
+
+LOGIC_SECTION_HEADER = (
+    "; ===========================================\n"
+    "; LOGIC CONFIGURATIONS (630 logic-directions)\n"
+    "; Groups 1-5: Conservative (0.02 lot)\n"
+    "; Groups 6-10: Moderate (0.03 lot)\n"
+    "; Groups 11-15: Aggressive (0.05 lot)\n"
+    "; ===========================================\n"
+    "\n"
+)
+
+# No trailing newline after the closing banner
+FOOTER_TEMPLATE = (
+    "; ===========================================\n"
+    "; END OF CONFIGURATION v19\n"
+    "; Total Inputs Generated: {total_inputs}\n"
+    "; CHANGES: Higher lots, enabled filters, random variations\n"
+    "; ==========================================="
+)
 
-def generate_massive_setfile():
-    """Generate complete massive setfile v19 with all changes"""
-    lines = []
+def generate_massive_setfile(out):
+    """Write complete massive setfile v19 with all changes to out.
+
+    Returns the number of lines written.
+    """
+    write = out.write
     
     # Header
-    lines.append("; DAAVILEFX MASSIVE CONFIGURATION SETFILE v19")
-    lines.append(f"; Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("; Version: 19.0 MASSIVE (Testing Variant)")
-    lines.append("; Platform: MT4")
-    lines.append(";")
-    lines.append(f"; Structure: {GROUPS} groups × {len(ENGINES)} engines × {len(LOGICS)} logics × {len(DIRECTIONS)} directions")
-    lines.append(f"; Total Logic-Directions: {GROUPS * len(ENGINES) * len(LOGICS) * len(DIRECTIONS)}")
-    lines.append(f"; Fields per Logic: 88")
-    lines.append(f"; Total Logic Inputs: {GROUPS * len(ENGINES) * len(LOGICS) * len(DIRECTIONS) * 88}")
-    lines.append(f"; Global Inputs: ~50")
-    lines.append(f"; GRAND TOTAL: ~55,500 inputs")
-    lines.append(";")
-    lines.append("; CHANGES FROM v18:")
-    lines.append("; - InitialLot: 0.01 -> 0.02 (and higher for groups 6-15)")
-    lines.append("; - LastLot: 0.10 -> 0.20 (and higher for groups 6-15)")
-    lines.append("; - Added random variations across all parameters for testing")
-    lines.append("; - Enabled various filters and settings that were disabled")
-    lines.append("; - Changed magic numbers and session times")
-    lines.append("")
+    write(HEADER_TEMPLATE.format(timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+    line_count = HEADER_TEMPLATE.count("\n")
     
-    # Global Settings Section
-    lines.append("; ===========================================")
-    lines.append("; GLOBAL SETTINGS (Changed from v18)")
-    lines.append("; ===========================================")
-    lines.append("")
-    lines.extend(generate_global_inputs())
-    lines.append("")
+    write(_GLOBAL_INPUTS_TEXT)
+    line_count += len(GLOBAL_INPUTS) + 1
     
     # Logic Inputs Section
-    lines.append("; ===========================================")
-    lines.append("; LOGIC CONFIGURATIONS (630 logic-directions)")
-    lines.append("; Groups 1-5: Conservative (0.02 lot)")
-    lines.append("; Groups 6-10: Moderate (0.03 lot)")
-    lines.append("; Groups 11-15: Aggressive (0.05 lot)")
-    lines.append("; ===========================================")
-    lines.append("")
+    write(LOGIC_SECTION_HEADER)
+    line_count += LOGIC_SECTION_HEADER.count("\n")
     
-    total_inputs = 0
     for group in range(1, GROUPS + 1):
-        lines.append(f"; Group {group}")
-        lines.append(f"; ===========================================")
+        write(f"; Group {group}\n")
+        write(f"; ===========================================\n")
+        params = GROUP_PARAMS[group]
         
-        for engine in ENGINES:
-            for logic in LOGICS:
-                for direction in DIRECTIONS:
-                    logic_inputs = generate_logic_inputs(group, engine, logic, direction)
-                    lines.extend(logic_inputs)
-                    total_inputs += len(logic_inputs)
-                    lines.append("")  # Blank line between logics
+        for engine, suffix, direction, is_power, is_buy in COMBOS:
+            write(generate_logic_inputs(group, engine, suffix, direction, is_power, is_buy, params))
         
-        lines.append("")
+        write("\n")
+    
+    total_inputs = _N_LOGIC_DIRECTIONS * FIELDS_PER_LOGIC
+    # Per group: 2 banner lines + 1 blank; per logic-direction: its fields + 1 blank
+    line_count += GROUPS * 3 + _N_LOGIC_DIRECTIONS * (FIELDS_PER_LOGIC + 1)
     
     # Footer
-    lines.append("; ===========================================")
-    lines.append(f"; END OF CONFIGURATION v19")
-    lines.append(f"; Total Inputs Generated: {total_inputs + len(generate_global_inputs())}")
-    lines.append("; CHANGES: Higher lots, enabled filters, random variations")
-    lines.append("; ===========================================")
+    write(FOOTER_TEMPLATE.format(total_inputs=total_inputs + len(GLOBAL_INPUTS)))
+    line_count += FOOTER_TEMPLATE.count("\n") + 1
     
-    return '\n'.join(lines)
+    return line_count
 
 def main():
     """Generate and save the massive setfile v19"""
@@ -304,24 +420,15 @@ def main():
     print("  - Enabled various filters and settings")
     print()
     
-    # Generate content
-    content = generate_massive_setfile()
-    
-    # Count lines
-    lines = content.split('\n')
-    print(f"Generated {len(lines)} lines")
-    
-    # Calculate file size estimate
-    file_size_mb = len(content.encode('utf-8')) / (1024 * 1024)
-    print(f"Estimated file size: {file_size_mb:.2f} MB")
+    # Generate straight into the file (1MB write buffer)
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        line_count = generate_massive_setfile(f)
     
-    # Save file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(content)
+    print(f"Generated {line_count} lines")
     
     actual_size = os.path.getsize(output_file) / (1024 * 1024)
     print(f"\n[SUCCESS] Saved to: {output_file}")
-    print(f"[SUCCESS] Total lines: {len(lines)}")
+    print(f"[SUCCESS] Total lines: {line_count}")
     print(f"[SUCCESS] File size: {actual_size:.2f} MB")
     print(f"\nYou can now compare v18 and v19 in the dashboard!")
     
@@ -2,40 +2,95 @@
 """
 Generate COMPLETE DashboardExport.mqh with ALL 14 groups × 3 engines × 7 logics
 Auto-generates MQL4 code for all 2,732 MT4 inputs
+
+Usage: python generate_full_export.py [output.mqh]
+(writes to stdout when no output path is given)
 """
 
-def generate_logic_export(engine_id, logic_name, logic_suffix, group_num, is_last_logic, logic_short):
-    """Generate export code for a single logic"""
-    comma = "" if is_last_logic else ","
-    
-    # Handle optional Trigger inputs for Group 1
-    trigger_code = ""
-    if group_num == 1:
-        trigger_code = f'''
+import sys
+
+# Short logic name used in the gInput_G{group}_* variable names
+LOGIC_SHORT = {
+    "Power": "P", "Repower": "R", "Scalp": "S", "Stopper": "ST",
+    "STO": "STO", "SCA": "SCA", "RPO": "RPO",
+    "BPower": "BP", "BRepower": "BR", "BScalp": "BS", "BStopper": "BST",
+    "BSTO": "BSTO", "BSCA": "BSCA", "BRPO": "BRPO",
+    "CPower": "CP", "CRepower": "CR", "CScalp": "CS", "CStopper": "CST",
+    "CSTO": "CSTO", "CSCA": "CSCA", "CRPO": "CRPO",
+}
+
+def _trigger_code(logic_short):
+    """Optional Trigger inputs (Group 1 only)"""
+    return f'''
               "trigger_type": "" + EnumToString(gInput_G1_TriggerType_{logic_short}) + "",
               "trigger_bars": " + IntegerToString(gInput_G1_TriggerBars_{logic_short}) + ",
               "trigger_minutes": " + IntegerToString(gInput_G1_TriggerMinutes_{logic_short}) + ",
               "trigger_pips": " + DoubleToString(gInput_G1_TriggerPips_{logic_short}, 1) + ",
         '''
 
-    # Generate TrailStep 2-7
-    trail_step_extended = ""
-    for i in range(2, 8):
-        trail_step_extended += f'''
+def _trail_step_extended(logic_suffix, group_num):
+    """TrailStep 2-7 fields for one logic"""
+    return "".join(f'''
               "trail_step_{i}": " + DoubleToString(gInput_TrailStep{i}_{logic_suffix}{group_num}, 1) + ",
               "trail_step_method_{i}": "" + EnumToString(gInput_TrailStepMethod{i}_{logic_suffix}{group_num}) + "",
               "trail_step_mode_{i}": "" + EnumToString(gInput_TrailStepMode{i}_{logic_suffix}{group_num}) + "",
               "trail_step_cycle_{i}": " + IntegerToString(gInput_TrailStepCycle{i}_{logic_suffix}{group_num}) + ",
               "trail_step_balance_{i}": " + DoubleToString(gInput_TrailStepBalance{i}_{logic_suffix}{group_num}, 2) + ",'''
+        for i in range(2, 8))
 
-    # Generate ClosePartial 2-4
-    close_partial_extended = ""
-    for i in range(2, 5):
-        close_partial_extended += f'''
+def _close_partial_extended(logic_suffix, group_num):
+    """ClosePartial 2-4 fields for one logic"""
+    return "".join(f'''
               "close_partial_{i}": " + (gInput_ClosePartial{i}_{logic_suffix}{group_num} ? "true" : "false") + ",
               "close_partial_cycle_{i}": " + IntegerToString(gInput_ClosePartialCycle{i}_{logic_suffix}{group_num}) + ",
               "close_partial_mode_{i}": "" + EnumToString(gInput_ClosePartialMode{i}_{logic_suffix}{group_num}) + "",
               "close_partial_balance_{i}": "" + EnumToString(gInput_ClosePartialBalance{i}_{logic_suffix}{group_num}) + ",'''
+        for i in range(2, 5))
+
+FILE_HEADER = '''//+------------------------------------------------------------------+
+//| DashboardExport.mqh - AUTO GENERATED                             |
+//+------------------------------------------------------------------+
+#property copyright "DAAVFX"
+#property link      "https://daavfx.com"
+
+'''
+
+MAIN_EXPORT_FUNCTION = r'''//+------------------------------------------------------------------+
+//| Main Export Function                                             |
+//+------------------------------------------------------------------+
+void ExportDashboardConfig(string filename)
+{
+   int handle = FileOpen(filename, FILE_WRITE|FILE_TXT|FILE_ANSI);
+   if(handle == INVALID_HANDLE) {
+      Print("Error opening file for export: ", GetLastError());
+      return;
+   }
+
+   FileWriteString(handle, "{\n");
+   FileWriteString(handle, "  \"timestamp\": \"" + TimeToString(TimeCurrent()) + "\",\n");
+   FileWriteString(handle, "  \"engines\": [\n");
+
+   ExportEngine_A_All(handle);
+   FileWriteString(handle, ",\n");
+   ExportEngine_B_All(handle);
+   FileWriteString(handle, ",\n");
+   ExportEngine_C_All(handle);
+
+   FileWriteString(handle, "\n  ]\n");
+   FileWriteString(handle, "}");
+   FileClose(handle);
+   Print("Dashboard configuration exported to: ", filename);
+}
+'''
+
+def generate_logic_export(engine_id, logic_name, logic_suffix, group_num, is_last_logic, logic_short):
+    """Generate export code for a single logic"""
+    comma = "" if is_last_logic else ","
+    
+    # Handle optional Trigger inputs for Group 1
+    trigger_code = _trigger_code(logic_short) if group_num == 1 else ""
+    trail_step_extended = _trail_step_extended(logic_suffix, group_num)
+    close_partial_extended = _close_partial_extended(logic_suffix, group_num)
 
     code = f'''            {{
               "logic_name": "{logic_name}",
@@ -78,10 +133,21 @@ def generate_logic_export(engine_id, logic_name, logic_suffix, group_num, is_las
     
     return code
 
+def _group_header(group):
+    """'// Group N' comment plus the group-level FileWriteString line"""
+    return (f'''   // Group {group}\n'''
+            f'''   FileWriteString(handle, "        {{\\\"group_number\\\": {group}, \\\"enabled\\\": true, \\\"reverse_mode\\\": " + (gInput_Group{group}_ReverseMode ? "true" : "false") + ", \\\"hedge_mode\\\": " + (gInput_Group{group}_HedgeMode ? "true" : "false") + ", \\\"hedge_reference\\\": \\"" + EnumToString(gInput_Group{group}_HedgeReference) + "\\", \\\"entry_delay_bars\\\": " + IntegerToString(gInput_Group{group}_EntryDelayBars) + ", \\\"logics\\\": [\\n");\n''')
+
+# Group headers are engine-independent; indexed by group number (1-based)
+GROUP_HEADERS = (None,) + tuple(_group_header(g) for g in range(1, 21))
+
+GROUP_CLOSE = '''   FileWriteString(handle, "      ]},\\n");\n'''
+LAST_GROUP_CLOSE = '''   FileWriteString(handle, "      ]}\\n");\n'''
+
 def generate_engine_export(engine_id, engine_name, max_power_var, logics_info):
     """Generate export function for entire engine"""
     
-    code = f'''//+------------------------------------------------------------------+
+    parts = [f'''//+------------------------------------------------------------------+
 //| Export {engine_name} - ALL 14 GROUPS × 7 LOGICS                 |
 //+------------------------------------------------------------------+
 void ExportEngine_{engine_id}_All(int handle)
@@ -92,47 +158,27 @@ void ExportEngine_{engine_id}_All(int handle)
    FileWriteString(handle, "      \\"max_power_orders\\": " + IntegerToString({max_power_var}) + ",\\n");
    FileWriteString(handle, "      \\"groups\\": [\\n");
    
-'''
+''']
     
     for group in range(1, 21):  # Groups 1-20
-        code += f'''   // Group {group}\n'''
-        code += f'''   FileWriteString(handle, "        {{\\\"group_number\\\": {group}, \\\"enabled\\\": true, \\\"reverse_mode\\\": " + (gInput_Group{group}_ReverseMode ? "true" : "false") + ", \\\"hedge_mode\\\": " + (gInput_Group{group}_HedgeMode ? "true" : "false") + ", \\\"hedge_reference\\\": \\"" + EnumToString(gInput_Group{group}_HedgeReference) + "\\", \\\"entry_delay_bars\\\": " + IntegerToString(gInput_Group{group}_EntryDelayBars) + ", \\\"logics\\\": [\\n");\n'''
+        parts.append(GROUP_HEADERS[group])
         
         for i, (logic_name, logic_suffix) in enumerate(logics_info):
-            logic_short = logic_suffix.replace("P", "Power").replace("R", "Repower").replace("S", "Scalp").replace("ST", "Stopper").replace("STO", "STO").replace("SCA", "SCA").replace("RPO", "RPO")
-            # Logic short correction for correct variable mapping
-            if logic_name == "Power": logic_short = "P"
-            elif logic_name == "Repower": logic_short = "R"
-            elif logic_name == "Scalp": logic_short = "S"
-            elif logic_name == "Stopper": logic_short = "ST"
-            elif logic_name == "STO": logic_short = "STO"
-            elif logic_name == "SCA": logic_short = "SCA"
-            elif logic_name == "RPO": logic_short = "RPO"
-            elif logic_name == "BPower": logic_short = "BP"
-            elif logic_name == "BRepower": logic_short = "BR"
-            elif logic_name == "BScalp": logic_short = "BS"
-            elif logic_name == "BStopper": logic_short = "BST"
-            elif logic_name == "BSTO": logic_short = "BSTO"
-            elif logic_name == "BSCA": logic_short = "BSCA"
-            elif logic_name == "BRPO": logic_short = "BRPO"
-            elif logic_name == "CPower": logic_short = "CP"
-            elif logic_name == "CRepower": logic_short = "CR"
-            elif logic_name == "CScalp": logic_short = "CS"
-            elif logic_name == "CStopper": logic_short = "CST"
-            elif logic_name == "CSTO": logic_short = "CSTO"
-            elif logic_name == "CSCA": logic_short = "CSCA"
-            elif logic_name == "CRPO": logic_short = "CRPO"
+            logic_short = LOGIC_SHORT[logic_name]
             
             is_last = (i == len(logics_info) - 1)
-            code += generate_logic_export(engine_id, logic_name, logic_suffix, group, is_last, logic_short)
+            parts.append(generate_logic_export(engine_id, logic_name, logic_suffix, group, is_last, logic_short))
             
-        code += f'''   FileWriteString(handle, "      ]}}{"," if group < 20 else ""}\\n");\n'''
-        
-    code += '''   FileWriteString(handle, "   ]\\n");
+        parts.append(GROUP_CLOSE)
+    
+    # No trailing comma after the last group
+    parts[-1] = LAST_GROUP_CLOSE
+    
+    parts.append('''   FileWriteString(handle, "   ]\\n");
    FileWriteString(handle, "    }");
 }
-'''
-    return code
+''')
+    return "".join(parts)
 
 if __name__ == "__main__":
     engines = [
@@ -147,39 +193,17 @@ if __name__ == "__main__":
         ])
     ]
 
-    print("//+------------------------------------------------------------------+")
-    print("//| DashboardExport.mqh - AUTO GENERATED                             |")
-    print("//+------------------------------------------------------------------+")
-    print("#property copyright \"DAAVFX\"")
-    print("#property link      \"https://daavfx.com\"")
-    print("")
-    
+    parts = [FILE_HEADER]
     for eng_id, eng_name, max_var, logics in engines:
-        print(generate_engine_export(eng_id, eng_name, max_var, logics))
-
-    print("//+------------------------------------------------------------------+")
-    print("//| Main Export Function                                             |")
-    print("//+------------------------------------------------------------------+")
-    print("void ExportDashboardConfig(string filename)")
-    print("{")
-    print("   int handle = FileOpen(filename, FILE_WRITE|FILE_TXT|FILE_ANSI);")
-    print("   if(handle == INVALID_HANDLE) {")
-    print("      Print(\"Error opening file for export: \", GetLastError());")
-    print("      return;")
-    print("   }")
-    print("")
-    print("   FileWriteString(handle, \"{\\n\");")
-    print("   FileWriteString(handle, \"  \\\"timestamp\\\": \\\"\" + TimeToString(TimeCurrent()) + \"\\\",\\n\");")
-    print("   FileWriteString(handle, \"  \\\"engines\\\": [\\n\");")
-    print("")
-    print("   ExportEngine_A_All(handle);")
-    print("   FileWriteString(handle, \",\\n\");")
-    print("   ExportEngine_B_All(handle);")
-    print("   FileWriteString(handle, \",\\n\");")
-    print("   ExportEngine_C_All(handle);")
-    print("")
-    print("   FileWriteString(handle, \"\\n  ]\\n\");")
-    print("   FileWriteString(handle, \"}\");")
-    print("   FileClose(handle);")
-    print("   Print(\"Dashboard configuration exported to: \", filename);")
-    print("}")
+        parts.append(generate_engine_export(eng_id, eng_name, max_var, logics))
+        parts.append("\n")
+    parts.append(MAIN_EXPORT_FUNCTION)
+
+    # One write for the whole file instead of a print() per line
+    output = "".join(parts)
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "w", encoding="utf-8", buffering=1 << 16) as out:
+            out.write(output)
+    else:
+        sys.stdout.write(output)
+        sys.stdout.flush()
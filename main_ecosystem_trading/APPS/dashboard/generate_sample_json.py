@@ -9,6 +9,139 @@ This script generates a complete JSON export with all:
 
 import json
 from datetime import datetime
+from types import MappingProxyType
+
+try:
+    import orjson  # optional: much faster dump of the ~1.5MB sample export
+except ImportError:
+    orjson = None
+
+# Default per-logic config (read-only); merged into a new dict for each of
+# the 420 logics. logic_name/logic_id are placeholders so the key order stays the same.
+DEFAULT_LOGIC = MappingProxyType({
+    # Metadata
+    "logic_name": None,
+    "logic_id": None,
+    "enabled": True,
+    
+    # Base params
+    "initial_lot": 0.02,
+    "multiplier": 1.2,
+    "grid": 300.0,
+    "trail_method": "Points",
+    "trail_value": 3000.0,
+    "trail_start": 1.0,
+    "trail_step": 1500.0,
+    "trail_step_method": "Step_Points",
+    
+    # Logic specific
+    "close_targets": "1,2,3",
+    "order_count_reference": "Logic_Self",
+    "reset_lot_on_restart": False,
+    
+    # TPSL
+    "use_tp": False,
+    "tp_mode": "TPSL_Points",
+    "tp_value": 0.0,
+    "use_sl": False,
+    "sl_mode": "TPSL_Points",
+    "sl_value": 0.0,
+    
+    # V17.04+ Reverse/Hedge per-logic (8 fields)
+    "reverse_enabled": False,
+    "hedge_enabled": False,
+    "reverse_scale": 100.0,
+    "hedge_scale": 50.0,
+    "reverse_reference": "Logic_None",
+    "hedge_reference": "Logic_None",
+    
+    # V17.04+ Trail Step Advanced (3 fields)
+    "trail_step_mode": "TrailStepMode_Auto",
+    "trail_step_cycle": 1,
+    "trail_step_balance": 0.0,
+    
+    # Trail Step 2-7
+    "trail_step_2": 1500.0,
+    "trail_step_method_2": "Step_Points",
+    "trail_step_cycle_2": 1,
+    "trail_step_balance_2": 0.0,
+    "trail_step_mode_2": "TrailStepMode_Auto",
+
+    "trail_step_3": 1500.0,
+    "trail_step_method_3": "Step_Points",
+    "trail_step_cycle_3": 1,
+    "trail_step_balance_3": 0.0,
+    "trail_step_mode_3": "TrailStepMode_Auto",
+
+    "trail_step_4": 1500.0,
+    "trail_step_method_4": "Step_Points",
+    "trail_step_cycle_4": 1,
+    "trail_step_balance_4": 0.0,
+    "trail_step_mode_4": "TrailStepMode_Auto",
+
+    "trail_step_5": 1500.0,
+    "trail_step_method_5": "Step_Points",
+    "trail_step_cycle_5": 1,
+    "trail_step_balance_5": 0.0,
+    "trail_step_mode_5": "TrailStepMode_Auto",
+
+    "trail_step_6": 1500.0,
+    "trail_step_method_6": "Step_Points",
+    "trail_step_cycle_6": 1,
+    "trail_step_balance_6": 0.0,
+    "trail_step_mode_6": "TrailStepMode_Auto",
+
+    "trail_step_7": 1500.0,
+    "trail_step_method_7": "Step_Points",
+    "trail_step_cycle_7": 1,
+    "trail_step_balance_7": 0.0,
+    "trail_step_mode_7": "TrailStepMode_Auto",
+
+    # Close Partial (5 fields)
+    "close_partial": False,
+    "close_partial_cycle": 3,
+    "close_partial_mode": "PartialMode_Low",
+    "close_partial_balance": "PartialBalance_Balanced",
+    "close_partial_trail_step_mode": "TrailStepMode_Auto",
+
+    # Close Partial 2-4
+    "close_partial_2": False,
+    "close_partial_cycle_2": 3,
+    "close_partial_mode_2": "PartialMode_Low",
+    "close_partial_balance_2": "PartialBalance_Balanced",
+
+    "close_partial_3": False,
+    "close_partial_cycle_3": 3,
+    "close_partial_mode_3": "PartialMode_Low",
+    "close_partial_balance_3": "PartialBalance_Balanced",
+
+    "close_partial_4": False,
+    "close_partial_cycle_4": 3,
+    "close_partial_mode_4": "PartialMode_Low",
+    "close_partial_balance_4": "PartialBalance_Balanced",
+})
+
+# Default time-filter session; session_number/day are filled per session
+DEFAULT_SESSION = MappingProxyType({
+    "session_number": None,
+    "enabled": False,
+    "day": None,
+    "start_hour": 9,
+    "start_minute": 30,
+    "end_hour": 17,
+    "end_minute": 0,
+    "action": "TriggerAction_StopEA_KeepTrades",
+    "auto_restart": True,
+    "restart_mode": "Restart_Immediate",
+    "restart_bars": 0,
+    "restart_minutes": 0,
+    "restart_pips": 0,
+})
+
+# Logic names in export order, and their setfile suffixes (same order)
+LOGIC_NAMES = ("Power", "Repower", "Scalper", "Stopper", "STO", "SCA", "RPO")
+LOGIC_SUFFIXES = ("P", "R", "S", "ST", "STO", "SCA", "RPO")
+LOGIC_SUFFIX = dict(zip(LOGIC_NAMES, LOGIC_SUFFIXES))
 
 def generate_set_file(config, filename):
     """Generates a standard MT4/MT5 .set file for visible inputs (Group 1)."""
@@ -19,77 +152,77 @@ def generate_set_file(config, filename):
     TRAIL_STEP_MODES = {"TrailStepMode_Auto": 0, "TrailStepMode_Fixed": 1, "TrailStepMode_PerOrder": 2, "TrailStepMode_Disabled": 3}
     TPSL_MODES = {"TPSL_Points": 0, "TPSL_Percent": 1, "TPSL_Currency": 2}
     
-    logic_suffix_map = {
-        "Power": "P", "Repower": "R", "Scalper": "S", "Stopper": "ST", 
-        "STO": "STO", "SCA": "SCA", "RPO": "RPO"
-    }
+    # Build the whole file in memory and write it once
+    parts = [
+        "; DAAVFX V17.04 Generated Setfile\n"
+        "; Contains Group 1 (Visible) inputs + Global Settings\n"
+        "; For Hidden inputs (Groups 2-20), use the JSON config loader.\n\n"
+    ]
     
-    with open(filename, "w") as f:
-        f.write("; DAAVFX V17.04 Generated Setfile\n")
-        f.write("; Contains Group 1 (Visible) inputs + Global Settings\n")
-        f.write("; For Hidden inputs (Groups 2-20), use the JSON config loader.\n\n")
-        
-        # General Settings
-        gen = config["general"]
-        f.write(f"MagicNumber={gen.get('magic_number', 777)}\n")
-        f.write(f"MaxSlippage={gen.get('max_slippage_points', 30.0)}\n")
-        f.write(f"EnableLogs={1 if gen.get('enable_logs', True) else 0}\n")
-        f.write("\n")
-        
-        # Iterate Engines (Assuming Single Engine context for Setfile, or flattening)
-        # Standard EA usually runs one Engine context or manages them internally.
-        # We will generate inputs for Engine A (Primary)
-        
-        engine_a = next((e for e in config["engines"] if e["engine_id"] == "A"), None)
-        if not engine_a:
-            return
-
-        # Group 1 Only
+    # General Settings
+    gen = config["general"]
+    parts.append(
+        f"MagicNumber={gen.get('magic_number', 777)}\n"
+        f"MaxSlippage={gen.get('max_slippage_points', 30.0)}\n"
+        f"EnableLogs={1 if gen.get('enable_logs', True) else 0}\n"
+        "\n"
+    )
+    
+    # Iterate Engines (Assuming Single Engine context for Setfile, or flattening)
+    # Standard EA usually runs one Engine context or manages them internally.
+    # We will generate inputs for Engine A (Primary)
+    
+    engine_a = next((e for e in config["engines"] if e["engine_id"] == "A"), None)
+    
+    # Group 1 Only
+    group1 = None
+    if engine_a:
         group1 = next((g for g in engine_a["groups"] if g["group_number"] == 1), None)
-        if group1:
-            f.write("; ==== GROUP 1 ====\n")
-            f.write("gInput_str1==== GROUP 1 ====\n")
+    if group1:
+        parts.append("; ==== GROUP 1 ====\n")
+        parts.append("gInput_str1==== GROUP 1 ====\n")
+        
+        for logic in group1["logics"]:
+            name = logic["logic_name"] # Power, Repower...
+            suffix = LOGIC_SUFFIX.get(name, "Unknown")
+            suffix_full = f"{suffix}1" # P1, R1...
             
-            for logic in group1["logics"]:
-                name = logic["logic_name"] # Power, Repower...
-                suffix = logic_suffix_map.get(name, "Unknown")
-                suffix_full = f"{suffix}1" # P1, R1...
-                
-                f.write(f"; --- {name} 1 ---\n")
-                f.write(f"gInput_str1_{name}={name} 1\n")
-                
-                # Core Inputs
-                if "initial_lot" in logic:
-                    f.write(f"gInput_Initial_loT_{suffix_full}={logic['initial_lot']}\n")
-                if "multiplier" in logic:
-                    f.write(f"gInput_Mult_{suffix_full}={logic['multiplier']}\n")
-                if "grid" in logic:
-                    f.write(f"gInput_Grid_{suffix_full}={logic['grid']}\n")
-                
-                # Trail
-                tm = logic.get("trail_method", "Points")
-                f.write(f"gInput_Trail_{suffix_full}={TRAIL_METHODS.get(tm, 0)}\n")
-                f.write(f"gInput_TrailValue_{suffix_full}={logic.get('trail_value', 0)}\n")
-                f.write(f"gInput_Trail_Start_{suffix_full}={logic.get('trail_start', 0)}\n")
-                f.write(f"gInput_TrailStep_{suffix_full}={logic.get('trail_step', 0)}\n")
-                
-                tsm = logic.get("trail_step_method", "Step_Points")
-                f.write(f"gInput_TrailStepMethod_{suffix_full}={TRAIL_STEP_METHODS.get(tsm, 0)}\n")
-                
-                # Logic Specific
-                if name == "Power":
-                    f.write(f"gInput_MaxPowerOrders={engine_a.get('max_power_orders', 10)}\n")
-                    f.write(f"gInput_LastLotPower={logic.get('last_lot', 0.63)}\n")
-                else:
-                    f.write(f"gInput_Start{name}={logic.get('start_level', 4)}\n")
-                    f.write(f"gInput_LastLot{name}={logic.get('last_lot', 0.12)}\n")
-
-                f.write("\n")
+            parts.append(f"; --- {name} 1 ---\n"
+                         f"gInput_str1_{name}={name} 1\n")
+            
+            # Core Inputs
+            if "initial_lot" in logic:
+                parts.append(f"gInput_Initial_loT_{suffix_full}={logic['initial_lot']}\n")
+            if "multiplier" in logic:
+                parts.append(f"gInput_Mult_{suffix_full}={logic['multiplier']}\n")
+            if "grid" in logic:
+                parts.append(f"gInput_Grid_{suffix_full}={logic['grid']}\n")
+            
+            # Trail
+            tm = logic.get("trail_method", "Points")
+            tsm = logic.get("trail_step_method", "Step_Points")
+            parts.append(
+                f"gInput_Trail_{suffix_full}={TRAIL_METHODS.get(tm, 0)}\n"
+                f"gInput_TrailValue_{suffix_full}={logic.get('trail_value', 0)}\n"
+                f"gInput_Trail_Start_{suffix_full}={logic.get('trail_start', 0)}\n"
+                f"gInput_TrailStep_{suffix_full}={logic.get('trail_step', 0)}\n"
+                f"gInput_TrailStepMethod_{suffix_full}={TRAIL_STEP_METHODS.get(tsm, 0)}\n"
+            )
+            
+            # Logic Specific
+            if name == "Power":
+                parts.append(f"gInput_MaxPowerOrders={engine_a.get('max_power_orders', 10)}\n"
+                             f"gInput_LastLotPower={logic.get('last_lot', 0.63)}\n\n")
+            else:
+                parts.append(f"gInput_Start{name}={logic.get('start_level', 4)}\n"
+                             f"gInput_LastLot{name}={logic.get('last_lot', 0.12)}\n\n")
+    
+    with open(filename, "w") as f:
+        f.write("".join(parts))
 
 def generate_full_export():
     """Generate complete V17.04+ compliant config."""
     
-    logic_names = ["Power", "Repower", "Scalper", "Stopper", "STO", "SCA", "RPO"]
     engine_ids = ["A", "B", "C"]
     
     engines = []
@@ -100,112 +233,11 @@ def generate_full_export():
         for group_num in range(1, 21):  # Groups 1-20
             logics = []
             
-            for logic_name in logic_names:
+            for logic_name in LOGIC_NAMES:
                 is_power = logic_name.lower() == "power"
                 logic_id = f"{engine_id}_{logic_name}_G{group_num}"
                 
-                logic = {
-                    # Metadata
-                    "logic_name": logic_name,
-                    "logic_id": logic_id,
-                    "enabled": True,
-                    
-                    # Base params
-                    "initial_lot": 0.02,
-                    "multiplier": 1.2,
-                    "grid": 300.0,
-                    "trail_method": "Points",
-                    "trail_value": 3000.0,
-                    "trail_start": 1.0,
-                    "trail_step": 1500.0,
-                    "trail_step_method": "Step_Points",
-                    
-                    # Logic specific
-                    "close_targets": "1,2,3",
-                    "order_count_reference": "Logic_Self",
-                    "reset_lot_on_restart": False,
-                    
-                    # TPSL
-                    "use_tp": False,
-                    "tp_mode": "TPSL_Points",
-                    "tp_value": 0.0,
-                    "use_sl": False,
-                    "sl_mode": "TPSL_Points",
-                    "sl_value": 0.0,
-                    
-                    # V17.04+ Reverse/Hedge per-logic (8 fields)
-                    "reverse_enabled": False,
-                    "hedge_enabled": False,
-                    "reverse_scale": 100.0,
-                    "hedge_scale": 50.0,
-                    "reverse_reference": "Logic_None",
-                    "hedge_reference": "Logic_None",
-                    
-                    # V17.04+ Trail Step Advanced (3 fields)
-                    "trail_step_mode": "TrailStepMode_Auto",
-                    "trail_step_cycle": 1,
-                    "trail_step_balance": 0.0,
-                    
-                    # Trail Step 2-7
-                    "trail_step_2": 1500.0,
-                    "trail_step_method_2": "Step_Points",
-                    "trail_step_cycle_2": 1,
-                    "trail_step_balance_2": 0.0,
-                    "trail_step_mode_2": "TrailStepMode_Auto",
-
-                    "trail_step_3": 1500.0,
-                    "trail_step_method_3": "Step_Points",
-                    "trail_step_cycle_3": 1,
-                    "trail_step_balance_3": 0.0,
-                    "trail_step_mode_3": "TrailStepMode_Auto",
-
-                    "trail_step_4": 1500.0,
-                    "trail_step_method_4": "Step_Points",
-                    "trail_step_cycle_4": 1,
-                    "trail_step_balance_4": 0.0,
-                    "trail_step_mode_4": "TrailStepMode_Auto",
-
-                    "trail_step_5": 1500.0,
-                    "trail_step_method_5": "Step_Points",
-                    "trail_step_cycle_5": 1,
-                    "trail_step_balance_5": 0.0,
-                    "trail_step_mode_5": "TrailStepMode_Auto",
-
-                    "trail_step_6": 1500.0,
-                    "trail_step_method_6": "Step_Points",
-                    "trail_step_cycle_6": 1,
-                    "trail_step_balance_6": 0.0,
-                    "trail_step_mode_6": "TrailStepMode_Auto",
-
-                    "trail_step_7": 1500.0,
-                    "trail_step_method_7": "Step_Points",
-                    "trail_step_cycle_7": 1,
-                    "trail_step_balance_7": 0.0,
-                    "trail_step_mode_7": "TrailStepMode_Auto",
-
-                    # Close Partial (5 fields)
-                    "close_partial": False,
-                    "close_partial_cycle": 3,
-                    "close_partial_mode": "PartialMode_Low",
-                    "close_partial_balance": "PartialBalance_Balanced",
-                    "close_partial_trail_step_mode": "TrailStepMode_Auto",
-
-                    # Close Partial 2-4
-                    "close_partial_2": False,
-                    "close_partial_cycle_2": 3,
-                    "close_partial_mode_2": "PartialMode_Low",
-                    "close_partial_balance_2": "PartialBalance_Balanced",
-
-                    "close_partial_3": False,
-                    "close_partial_cycle_3": 3,
-                    "close_partial_mode_3": "PartialMode_Low",
-                    "close_partial_balance_3": "PartialBalance_Balanced",
-
-                    "close_partial_4": False,
-                    "close_partial_cycle_4": 3,
-                    "close_partial_mode_4": "PartialMode_Low",
-                    "close_partial_balance_4": "PartialBalance_Balanced",
-                }
+                logic = DEFAULT_LOGIC | {"logic_name": logic_name, "logic_id": logic_id}
                 
                 # Non-Power specific fields
                 if not is_power:
@@ -281,21 +313,7 @@ def generate_full_export():
                     "session_filter_overrides_news": True,
                 },
                 "sessions": [
-                    {
-                        "session_number": i,
-                        "enabled": False,
-                        "day": i % 7,
-                        "start_hour": 9,
-                        "start_minute": 30,
-                        "end_hour": 17,
-                        "end_minute": 0,
-                        "action": "TriggerAction_StopEA_KeepTrades",
-                        "auto_restart": True,
-                        "restart_mode": "Restart_Immediate",
-                        "restart_bars": 0,
-                        "restart_minutes": 0,
-                        "restart_pips": 0,
-                    }
+                    {**DEFAULT_SESSION, "session_number": i, "day": i % 7}
                     for i in range(1, 8)
                 ],
             },
@@ -319,8 +337,12 @@ if __name__ == "__main__":
     config = generate_full_export()
     
     # Write to file
-    with open("SAMPLE_FULL_EXPORT_TEST.json", "w") as f:
-        json.dump(config, f, indent=2)
+    if orjson is not None:
+        with open("SAMPLE_FULL_EXPORT_TEST.json", "wb") as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        with open("SAMPLE_FULL_EXPORT_TEST.json", "w") as f:
+            json.dump(config, f, indent=2)
     
     # Stats
     total_logics = sum(